@@ -0,0 +1,31 @@
+import io
+
+import numpy as np
+
+from utensor_cgen.backend.utensor.snippets import (ContextGlobalArrayContainer,
+                                                   ContextHeaderSnippet,
+                                                   WeightSnippet)
+from utensor_cgen.backend.utensor.snippets.composer import Composer
+
+
+def _snippets():
+    weight = WeightSnippet('inline_weight_0',
+                           np.dtype('float32'),
+                           (2, 3),
+                           np.arange(6, dtype=np.float32))
+    container = ContextGlobalArrayContainer([weight])
+    header = ContextHeaderSnippet('model', 'get_model_ctx')
+    return [container, header]
+
+def test_compose_to():
+    composer = Composer(_snippets())
+    fp = io.StringIO()
+    composer.compose_to(fp)
+    assert fp.getvalue() == Composer(_snippets()).compose()
+
+def test_compose_to_cached():
+    composer = Composer(_snippets())
+    text = composer.compose()
+    fp = io.StringIO()
+    composer.compose_to(fp)
+    assert fp.getvalue() == text
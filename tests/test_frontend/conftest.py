@@ -0,0 +1,34 @@
+import numpy as np
+import pytest
+
+import tensorflow as tf
+
+
+@pytest.fixture(name='multi_output_graph_tuple')
+def multi_output_graph():
+    graph = tf.Graph()
+    with graph.as_default():
+        x = tf.constant(np.random.rand(4, 6), dtype=tf.float32, name='x')
+        # Split: number_attr outputs
+        s0, s1 = tf.split(x, 2, axis=1, name='split')
+        # Unpack: number_attr outputs
+        rows = tf.unstack(x, axis=0, name='unstack')
+        # QuantizeV2: quantized dtype output
+        q_x, _, _ = tf.quantization.quantize(x, 0.0, 1.0, tf.quint8, name='quant_x')
+        with tf.control_dependencies([q_x.op]):
+            y = tf.add(s1, s0, name='y')
+        z = tf.add(rows[0], rows[3], name='z')
+    return graph, [y.op.name, z.op.name]
+
+
+@pytest.fixture(name='type_list_graph')
+def type_list_graph():
+    # IdentityN: type_list_attr outputs
+    # NOTE: its list of types attr can not be converted by AttrListValueConverter,
+    # so this graph is not for GraphDefParser.parse
+    graph = tf.Graph()
+    with graph.as_default():
+        x = tf.constant(np.random.rand(4, 6), dtype=tf.float32, name='x')
+        i = tf.constant(np.arange(3), dtype=tf.int32, name='i')
+        tf.identity_n([x, i], name='identity_n')
+    return graph
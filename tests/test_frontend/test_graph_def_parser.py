@@ -0,0 +1,56 @@
+from utensor_cgen.frontend.tensorflow import GraphDefParser
+
+
+def test_parse_tensors_meta(multi_output_graph_tuple):
+    graph, _ = multi_output_graph_tuple
+    graph_def = graph.as_graph_def(add_shapes=True)
+    tensors_meta = GraphDefParser._tf_parse_tensors_meta(graph_def)
+    assert tensors_meta is not None
+    assert tensors_meta == GraphDefParser._tf_import_tensors_meta(graph_def)
+    assert len(tensors_meta['split']) == 2
+    assert len(tensors_meta['unstack']) == 4
+    assert len(tensors_meta['quant_x']) == 3
+
+def test_parse_tensors_meta_type_list(type_list_graph):
+    graph_def = type_list_graph.as_graph_def(add_shapes=True)
+    tensors_meta = GraphDefParser._tf_parse_tensors_meta(graph_def)
+    assert tensors_meta is not None
+    assert tensors_meta == GraphDefParser._tf_import_tensors_meta(graph_def)
+    assert [str(dtype) for dtype, _ in tensors_meta['identity_n']] == \
+        ['float32', 'int32']
+
+def test_parse_without_shapes(multi_output_graph_tuple):
+    graph, _ = multi_output_graph_tuple
+    assert GraphDefParser._tf_parse_tensors_meta(graph.as_graph_def()) is None
+
+def test_parse_missing_attr(multi_output_graph_tuple):
+    graph, _ = multi_output_graph_tuple
+    graph_def = graph.as_graph_def(add_shapes=True)
+    for node in graph_def.node:
+        if node.name == 'split':
+            del node.attr['num_split']
+    assert GraphDefParser._tf_parse_tensors_meta(graph_def) is None
+
+def test_parse_same_as_import(multi_output_graph_tuple):
+    graph, output_nodes = multi_output_graph_tuple
+    ugraph_1 = GraphDefParser.parse(
+        graph.as_graph_def(add_shapes=True),
+        output_nodes=output_nodes
+    )
+    ugraph_2 = GraphDefParser.parse(
+        graph.as_graph_def(),
+        output_nodes=output_nodes
+    )
+    assert set(ugraph_1.ops_info) == set(ugraph_2.ops_info)
+    for op_name, op_1 in ugraph_1.ops_info.items():
+        op_2 = ugraph_2.ops_info[op_name]
+        for tensors_1, tensors_2 in [
+            (op_1.input_tensors, op_2.input_tensors),
+            (op_1.output_tensors, op_2.output_tensors),
+        ]:
+            assert [t.name for t in tensors_1] == [t.name for t in tensors_2]
+            assert [t.dtype for t in tensors_1] == [t.dtype for t in tensors_2]
+            assert [t.shape for t in tensors_1] == [t.shape for t in tensors_2]
+    # control input is not a data input
+    assert [t.name for t in ugraph_1.ops_info['y'].input_tensors] == \
+        ['split:1', 'split:0']
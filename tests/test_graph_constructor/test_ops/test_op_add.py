@@ -21,5 +21,5 @@ def test_op_add(ugraph, quant_trans):
             is_output=True
         )
 
-    assert tensor_z.shape == [1, 3, 5]
+    assert tensor_z.shape == (1, 3, 5)
     quant_trans.transform(ugraph)
@@ -24,8 +24,8 @@ def test_op_argmax(ugraph, quant_trans):
             dtype=np.dtype('int64'),
             is_output=True,
         )
-    assert tensor_out1.shape == [5, 7]
+    assert tensor_out1.shape == (5, 7)
     assert tensor_out1.dtype == np.dtype('int32')
-    assert tensor_out2.shape == [3, 5]
+    assert tensor_out2.shape == (3, 5)
     assert tensor_out2.dtype == np.dtype('int64')
     quant_trans.transform(ugraph)
@@ -10,5 +10,5 @@ def test_op_const(ugraph, quant_trans):
             is_output=True
         )
 
-    assert out_tensor.shape == [3, 3]
+    assert out_tensor.shape == (3, 3)
     quant_trans.transform(ugraph)
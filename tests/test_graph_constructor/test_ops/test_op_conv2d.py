@@ -23,5 +23,5 @@ def test_op_conv2d(ugraph, quant_trans):
             stride_width=2,
             is_output=True
         )
-    assert out.shape == [10, 256, 256, 10]
+    assert out.shape == (10, 256, 256, 10)
     quant_trans.transform(ugraph)
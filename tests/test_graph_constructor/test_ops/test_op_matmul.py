@@ -20,5 +20,5 @@ def test_op_matmul(ugraph, quant_trans):
             is_output=True
         )
 
-    assert tensor_z.shape == [3, 4]
+    assert tensor_z.shape == (3, 4)
     quant_trans.transform(ugraph)
@@ -32,7 +32,7 @@ def test_op_max(ugraph, quant_trans):
             keepdims=False,
             is_output=True,
         )
-    assert tensor_out1.shape == [1, 5, 9, 2]
-    assert tensor_out2.shape == [3, 1, 9, 2]
-    assert tensor_out3.shape == [3, 5, 9]
+    assert tensor_out1.shape == (1, 5, 9, 2)
+    assert tensor_out2.shape == (3, 1, 9, 2)
+    assert tensor_out3.shape == (3, 5, 9)
     quant_trans.transform(ugraph)
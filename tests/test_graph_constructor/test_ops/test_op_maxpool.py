@@ -19,5 +19,5 @@ def test_op_maxpool(ugraph, quant_trans):
             padding='SAME',
             is_output=True
         )
-    assert tensor_out.shape == [10, 128, 128, 5]
+    assert tensor_out.shape == (10, 128, 128, 5)
     quant_trans.transform(ugraph)
@@ -14,5 +14,5 @@ def test_op_relu(ugraph, quant_trans):
             name='relu',
             is_output=True
         )
-    assert out.shape == [3, 5]
+    assert out.shape == (3, 5)
     quant_trans.transform(ugraph)
@@ -69,3 +69,14 @@ def gen_vgg_graph():
             if i != num_layers:
                 in_feat = tf.nn.dropout(in_feat, rate=rate, name='dropout_{}'.format(i))   
     return GraphDefParser.parse(graph.as_graph_def(), output_nodes=[in_feat.op.name])
+
+
+@pytest.fixture(name='no_dropout_graph_tuple')
+def no_dropout_graph_tuple():
+    graph = tf.Graph()
+    with graph.as_default():
+        x = tf.constant(np.random.rand(3, 3), dtype=tf.float32, name='x')
+        bias = tf.constant(0.5, name='bias', dtype=tf.float32)
+        y = tf.add(x, bias, name='y')
+        z = tf.nn.relu(y, name='z')
+    return graph.as_graph_def(), [z.op.name]
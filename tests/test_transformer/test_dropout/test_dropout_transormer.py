@@ -81,3 +81,27 @@ def test_dropout_vgg(vgg_ugraph):
     new_ugraph = trans.transform(vgg_ugraph)
     for op_name in new_ugraph.ops_info:
         assert not op_name.startswith('dropout')
+
+def test_dropout_trans_no_dropout(no_dropout_graph_tuple, monkeypatch):
+    graph_def, output_nodes = no_dropout_graph_tuple
+    ugraph = GraphDefParser.parse(graph_def, output_nodes=output_nodes)
+    ori_topo_order = list(ugraph.topo_order)
+    ori_inputs = dict(
+        (op_name, [t.name for t in op.input_tensors])
+        for op_name, op in ugraph.ops_info.items()
+    )
+
+    def _fail(*args, **kwargs):
+        assert False, '_find_input should be skipped without dropout'
+
+    monkeypatch.setattr(DropoutTransformer, '_find_input', _fail)
+    transformer = DropoutTransformer(prune_graph=False)
+    new_ugraph = transformer.transform(ugraph)
+    # no rebuild, the same graph comes back
+    assert new_ugraph is ugraph
+    assert new_ugraph.output_nodes == output_nodes
+    assert new_ugraph.topo_order == ori_topo_order
+    assert dict(
+        (op_name, [t.name for t in op.input_tensors])
+        for op_name, op in new_ugraph.ops_info.items()
+    ) == ori_inputs
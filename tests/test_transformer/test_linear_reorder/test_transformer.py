@@ -10,4 +10,4 @@ def test_linear_reorder_1(subj_ugraph_1):
             'expecting MaxPool as input of Relu, get {}'.format(pool_op.op_type)
         assert pool_op.op_attr['ksize'].value.ints_value == [1, 3, 3, 1]
         assert pool_op.op_attr['strides'].value.ints_value == [1, 2, 2, 1]
-        assert pool_op.input_tensors[0].shape == [None, 512, 512, 10]
+        assert pool_op.input_tensors[0].shape == (None, 512, 512, 10)
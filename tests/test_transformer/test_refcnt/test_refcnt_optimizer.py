@@ -1,5 +1,7 @@
+from utensor_cgen.backend.utensor._code_generator import _get_ref_count
 from utensor_cgen.frontend.tensorflow import GraphDefParser
 from utensor_cgen.transformer import RefCntOptimizer
+from utensor_cgen.utils import NamescopedKWArgsParser
 
 
 def test_refcnt_optimizer(refgraph_tuple):
@@ -12,3 +14,14 @@ def test_refcnt_optimizer(refgraph_tuple):
             op_info = ugraph.ops_info[node_name]
             refcnts = op_info.op_attr["%s__ref_counts" % transformer.KWARGS_NAMESCOPE]
             assert refcnts == refcnt_ans[node_name]
+
+
+def test_get_ref_count():
+    ns_key = "%s__ref_counts" % RefCntOptimizer.KWARGS_NAMESCOPE
+    for op_attr, expected in [
+        ({ns_key: [3], 'ref_counts': [2], 'other__ref_counts': [5]}, 3),
+        ({'ref_counts': [2], 'other__ref_counts': [5]}, 2),
+        ({'other__ref_counts': [5]}, 0),
+    ]:
+        parser = NamescopedKWArgsParser(RefCntOptimizer.KWARGS_NAMESCOPE, op_attr)
+        assert _get_ref_count(op_attr) == parser.get('ref_counts', [0])[0] == expected
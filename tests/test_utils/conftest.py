@@ -0,0 +1,25 @@
+import pytest
+import tensorflow as tf
+
+
+@pytest.fixture(name='diamond_graph_tuple')
+def diamond_graph():
+    graph = tf.Graph()
+    with graph.as_default():
+        x = tf.constant(1, name='x', dtype=tf.float32)
+        y = tf.constant(2, name='y', dtype=tf.float32)
+        # reads x twice
+        a = tf.add_n([x, y, x], name='a')
+        b = tf.multiply(x, y, name='b')
+        c = tf.add(a, b, name='c')
+    return graph.as_graph_def(), [c.op.name]
+
+
+@pytest.fixture(name='repeated_input_graph_tuple')
+def repeated_input_graph():
+    graph = tf.Graph()
+    with graph.as_default():
+        x = tf.constant(1, name='x', dtype=tf.float32)
+        y = tf.constant(2, name='y', dtype=tf.float32)
+        c = tf.add_n([x, y, x], name='c')
+    return graph.as_graph_def(), [c.op.name]
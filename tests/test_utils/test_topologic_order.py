@@ -0,0 +1,34 @@
+import pytest
+
+from utensor_cgen.frontend.tensorflow import GraphDefParser
+from utensor_cgen.utils import get_topologic_order
+
+
+def _assert_inputs_first(ugraph):
+    position = dict((name, i) for i, name in enumerate(ugraph.topo_order))
+    for op_name in ugraph.topo_order:
+        op_info = ugraph.ops_info[op_name]
+        for in_op in op_info.input_nodes:
+            assert position[in_op.name] < position[op_name]
+
+
+def test_topo_order_diamond(diamond_graph_tuple):
+    graph_def, output_nodes = diamond_graph_tuple
+    ugraph = GraphDefParser.parse(graph_def, output_nodes=output_nodes)
+    assert sorted(ugraph.topo_order) == ['a', 'b', 'c', 'x', 'y']
+    _assert_inputs_first(ugraph)
+
+def test_topo_order_repeated_input(repeated_input_graph_tuple):
+    graph_def, output_nodes = repeated_input_graph_tuple
+    ugraph = GraphDefParser.parse(graph_def, output_nodes=output_nodes)
+    _assert_inputs_first(ugraph)
+    # depth-first post-order, inputs visited in order
+    assert ugraph.topo_order == ['x', 'y', 'c']
+
+def test_topo_order_cycle(diamond_graph_tuple):
+    graph_def, output_nodes = diamond_graph_tuple
+    ugraph = GraphDefParser.parse(graph_def, output_nodes=output_nodes)
+    x_op = ugraph.ops_info['x']
+    x_op.input_tensors.append(ugraph.ops_info['c'].output_tensors[0])
+    with pytest.raises(ValueError, match='Input graph is not a DAG'):
+        get_topologic_order(ugraph)
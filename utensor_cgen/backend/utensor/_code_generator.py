@@ -8,14 +8,12 @@ import numpy as np
 
 import tensorflow as tf
 from tensorflow.core.framework.graph_pb2 import GraphDef
-from tensorflow.tools.graph_transforms import TransformGraph
 from utensor_cgen.backend.base import BackendPart
 from utensor_cgen.frontend import FrontendSelector
 from utensor_cgen.ir import uTensorGraph
 from utensor_cgen.transformer.optimizer import RefCntOptimizer
 from utensor_cgen.transformer.pipeline import TransformerPipeline
-from utensor_cgen.utils import (NamescopedKWArgsParser, class_property,
-                                parse_toml)
+from utensor_cgen.utils import class_property, parse_toml
 
 from ._operators import OperatorFactory
 from .snippets import (CommentSnippet, ContextGlobalArrayContainer,
@@ -25,6 +23,26 @@ from .snippets.composer import Composer
 
 __all__ = ["uTensorCodeGenerator"]
 _logger = logging.getLogger('utensor-cli')
+_QUANTIZED_OPS = frozenset([
+  "Dequantize", "QuantizedMaxPool",
+  "QuantizeV2", "QuantizedMatMul",
+  "QuantizedRelu", "QuantizedAdd",
+  "RequantizationRange",
+  "Requantize",
+  "QuantizedReshape",
+  "QuantizedConv2D"
+])
+
+
+def _get_ref_count(op_attr):
+  """Return the first ref count in op_attr, preferring the RefCntOptimizer namescoped key over the shared one
+  """
+  ref_counts = op_attr.get(
+    '{}__ref_counts'.format(RefCntOptimizer.KWARGS_NAMESCOPE),
+    op_attr.get('ref_counts', [0])
+  )
+  return ref_counts[0]
+
 
 class uTensorCodeGenerator(BackendPart, object):
 
@@ -39,8 +57,7 @@ class uTensorCodeGenerator(BackendPart, object):
     final_config.update(config)
     self.src_fname = final_config['src_fname']
     self.params_dir = final_config['params_dir'].rstrip('/')
-    if not os.path.exists(self.params_dir):
-      os.makedirs(self.params_dir)
+    os.makedirs(self.params_dir, exist_ok=True)
     self.embed_data_dir = final_config['embed_params_dir'].rstrip('/')
     self.model_dir = final_config['model_dir'].rstrip('/')
     self.trans_methods = final_config['transform_methods']
@@ -80,20 +97,18 @@ class uTensorCodeGenerator(BackendPart, object):
       _logger.info('Saving transformed graph')
       pkl_fname = "quant_{}.pkl".format(ugraph.name)
       with open(pkl_fname, 'wb') as fid:
-        pickle.dump(quant_ugraph, fid)
+        pickle.dump(quant_ugraph, fid, protocol=pickle.HIGHEST_PROTOCOL)
       _logger.info('{} saved'.format(pkl_fname))
 
-    if not os.path.exists(os.path.join(self.params_dir, ugraph.name)):
-      os.makedirs(os.path.join(self.params_dir, ugraph.name))
+    idx_dir = os.path.join(self.params_dir, ugraph.name)
+    os.makedirs(idx_dir, exist_ok=True)
     for op_id, op_name in enumerate(quant_ugraph.topo_order):
       op_info = quant_ugraph.ops_info[op_name]
       op_type = op_info.op_type
       # TODO: better abstraction for snippet
       if op_type == "Placeholder":
-        parser = NamescopedKWArgsParser(RefCntOptimizer.KWARGS_NAMESCOPE, 
-                                        op_info.op_attr)
         out_tname = op_info.output_tensors[0].name
-        ref_count = parser.get('ref_counts', [0])[0]
+        ref_count = _get_ref_count(op_info.op_attr)
         container.template_vars["placeholders"].append(out_tname)
         container.template_vars["ref_counts"].append(ref_count)
         header_snippet.template_vars["placeholders"].append(out_tname)
@@ -101,7 +116,7 @@ class uTensorCodeGenerator(BackendPart, object):
         # TODO: the operator may correspond to multiple snippets (such as InlinTensor)
         # weight_container is passed to function for workaround
         snippet = opFactory.createOperatorSnippet(op_info,
-                                                  idx_dir=os.path.join(self.params_dir, ugraph.name),
+                                                  idx_dir=idx_dir,
                                                   embed_data_dir=self.embed_data_dir,
                                                   weight_container=weight_container,
                                                   data_manager=quant_ugraph.data_manager)
@@ -115,13 +130,12 @@ class uTensorCodeGenerator(BackendPart, object):
     composer.add_snippet(container)
 
     # generate cpp/hpp files
-    if not os.path.exists(self.model_dir):
-      os.makedirs(self.model_dir)
-    if any([method == 'inline' for method in self.trans_methods]):  
+    os.makedirs(self.model_dir, exist_ok=True)
+    if 'inline' in self.trans_methods:
       _logger.info("Generate weight file: %s", weight_header_fname)
       with open(os.path.join(self.model_dir, weight_header_fname), "w") as wf:
         wf.write('// Auto generated by utensor-cli\n\n')
-        wf.write(weight_container.render())
+        weight_container.render_to(wf)
     else:
       container.remove_header('"{}"'.format(weight_header_fname))
       
@@ -132,7 +146,7 @@ class uTensorCodeGenerator(BackendPart, object):
     _logger.info("Generate source file: %s", src_fname)
     with open(os.path.join(self.model_dir, src_fname), "w") as wf:
       wf.write('// Auto generated by utensor-cli\n\n')
-      wf.write(composer.compose())
+      composer.compose_to(wf)
 
   @class_property
   def default_config(cls):
@@ -158,19 +172,10 @@ class uTensorCodeGenerator(BackendPart, object):
   
   @classmethod
   def _check_non_quantized(cls, ugraph):
-    is_quantized = False
-    for op_info in ugraph.ops_info.values():
-      if op_info.op_type in [
-        "Dequantize", "QuantizedMaxPool",
-        "QuantizeV2", "QuantizedMatMul",
-        "QuantizedRelu", "QuantizedAdd",
-        "RequantizationRange",
-        "Requantize",
-        "QuantizedReshape",
-        "QuantizedConv2D"
-        ]:
-        is_quantized = True
-        break
+    is_quantized = any(
+      op_info.op_type in _QUANTIZED_OPS
+      for op_info in ugraph.ops_info.values()
+    )
     if is_quantized:
       _logger.warning(("Expecting non-quantized graph, "
                         "graph transformation/optimization might not work properly"))
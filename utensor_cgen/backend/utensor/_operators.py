@@ -1102,7 +1102,7 @@ class _InlineOperator(_Operator):
     ref_count = parser.get('ref_counts', [0])[0]
     pre_tname = self._prepare_tensor_name(out_tname)
     inline_tname = self._prepare_inline_array_name(out_tname)
-    value = op_info.op_attr['value'].value.np_array.flatten()
+    value = op_info.op_attr['value'].value.np_array.ravel()
     self._snippet = CreateTensorBinarySnippet(out_tname, tensor_shape=tensor_shape,
                                          tf_dtype=out_dtype,
                                          sptr_name=pre_tname,
@@ -49,6 +49,11 @@ class Snippet(SnippetBase):  # pylint: W0223
   def render(self):
     return self.template.render(**self.template_vars)
 
+  def render_to(self, fp):
+    """Stream the rendered text into the file object
+    """
+    self.template.stream(**self.template_vars).dump(fp)
+
 
 class SnippetContainerBase(SnippetBase):
 
@@ -72,3 +77,8 @@ class SnippetContainerBase(SnippetBase):
 
   def render(self):
     return self.template.render(snippets=self._snippets, **self.template_vars)
+
+  def render_to(self, fp):
+    """Stream the rendered text into the file object
+    """
+    self.template.stream(snippets=self._snippets, **self.template_vars).dump(fp)
@@ -110,7 +110,7 @@ class CreateTensorBinarySnippet(Snippet):
     self.template_vars["tensor_type"] = "BinaryTensor"
     self.template_vars["tensor_name"] = tensor_name
     #FIXME: a patch to make scalar RomTensor compilable: [] vs [1]
-    if tensor_shape == []:
+    if tensor_shape in ([], ()):
       tensor_shape = [1]
     self.template_vars["tensor_shape"] = self._to_shape_str(tensor_shape)
     self.template_vars["tensor_length"] = np.prod(tensor_shape)
@@ -804,7 +804,8 @@ class WeightSnippet(Snippet):
       Snippet.__init__(self)
       length = np.prod(shape)
       self.template_vars['type'] =  NP_TYPES_MAP[type].tensor_type_str 
-      self.template_vars['value'] = value
+      # render all the values at once instead of looping over them in the template
+      self.template_vars['value'] = ", ".join(map(str, value))
       self.template_vars['length'] = int(length) 
       self.template_vars['inline_name'] = inline_name 
 
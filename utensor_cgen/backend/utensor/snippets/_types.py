@@ -1,12 +1,14 @@
 # -*- coding:utf8 -*-
 from collections import namedtuple
+from types import MappingProxyType
 
 import numpy as np
 import tensorflow as tf
 
 _TYPE_MAP_VALUE = namedtuple("_TYPE_MAP_VALUE", ["importer_type_str", "tensor_type_str"])
 
-NP_TYPES_MAP = {
+# read-only, shared by all snippets
+NP_TYPES_MAP = MappingProxyType({
   np.dtype(tf.float32.as_numpy_dtype): _TYPE_MAP_VALUE(importer_type_str="float",
                                                        tensor_type_str="float"),
   np.dtype(tf.qint8.as_numpy_dtype): _TYPE_MAP_VALUE(importer_type_str="byte", 
@@ -23,5 +25,5 @@ NP_TYPES_MAP = {
                                                       tensor_type_str="uint16_t"),
   np.dtype('int8'): _TYPE_MAP_VALUE(importer_type_str="int8",
                                                       tensor_type_str="q7_t"),
-}
+})
 del _TYPE_MAP_VALUE
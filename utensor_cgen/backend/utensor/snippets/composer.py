@@ -21,13 +21,24 @@ class Composer(object):
 
   def compose(self):
     if not self._cached:
-      self._text = ""
-      self._compose_header()
-      for snippet in self._snippets:
-        self._text += snippet.render()
+      self._text = self._compose_header()
+      self._text += "".join(snippet.render() for snippet in self._snippets)
       self._cached = True
     return self._text
 
+  def compose_to(self, fp):
+    """Write the composed text into the file object
+
+    Snippets are streamed into ``fp`` one after another, the
+    whole text is not built in memory
+    """
+    if self._cached:
+      fp.write(self._text)
+      return
+    fp.write(self._compose_header())
+    for snippet in self._snippets:
+      snippet.render_to(fp)
+
   def add_snippet(self, snippet):
     if not isinstance(snippet, (Snippet, SnippetContainerBase)):
       msg = "expecting Snippet/SnippetContainerBase object, get {}".format(type(snippet))
@@ -41,6 +52,5 @@ class Composer(object):
       unique_headers.update(snp.headers)
     headers = [(header, 0) if _STD_PATTERN.match(header) else (header, 1) for header in unique_headers]
     headers = [t[0] for t in sorted(headers, key=lambda t: t[1], reverse=True)]
-    for header in headers:
-      self._text += "#include {}\n".format(header)
-    self._text += "\n\n"
+    header_text = "".join("#include {}\n".format(header) for header in headers)
+    return header_text + "\n\n"
@@ -1,3 +1,3 @@
 #include <stdint.h>
 
-const {{ type }} {{ inline_name }} [ {{ length }} ] = { {% for item in value %} {{ item }}, {% endfor %} };
+const {{ type }} {{ inline_name }} [ {{ length }} ] = { {{ value }} };
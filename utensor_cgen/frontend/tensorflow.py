@@ -7,11 +7,13 @@ import six
 
 import tensorflow as tf
 from google.protobuf import text_format
+from tensorflow.python.framework import op_def_registry
 from utensor_cgen.frontend import FrontendSelector
 from utensor_cgen.frontend.base import Parser
 from utensor_cgen.ir.base import OperationInfo, TensorInfo, uTensorGraph
 from utensor_cgen.legalizer import Legalizer
-from utensor_cgen.utils import random_str, topologic_order_graph
+from utensor_cgen.utils import (parse_tensor_name, random_str,
+                                topologic_order_graph)
 
 
 @FrontendSelector.register(target_exts=['.pb', '.pbtxt'])
@@ -25,30 +27,38 @@ class GraphDefParser(Parser):
     if output_nodes is None:
       output_nodes = [node.name for node in graph_def.node]
     
-    graph = tf.Graph()
-    with graph.as_default():
-      tf.import_graph_def(graph_def, name='')
+    # op name -> [(dtype, shape) of each output tensor]
+    tensors_meta = cls._tf_parse_tensors_meta(graph_def)
+    if tensors_meta is None:
+      tensors_meta = cls._tf_import_tensors_meta(graph_def)
     ugraph = uTensorGraph(
       name=graph_name,
       output_nodes=output_nodes,
       lib_name="tensorflow",
     )
     for node in graph_def.node:
-      op = graph.get_operation_by_name(node.name)
-      in_tensors = [TensorInfo(name=tensor.name,
-                               ugraph=ugraph,
-                               op_name=tensor.op.name,
-                               dtype=np.dtype(tensor.dtype.as_numpy_dtype),
-                               shape=cls._tf_parse_tshape(tensor.shape),
-                               )
-                    for tensor in op.inputs]
-      out_tensors = [TensorInfo(name=tensor.name,
+      in_tensors = []
+      for in_name in node.input:
+        if in_name.startswith('^'):
+          # control input
+          continue
+        in_op_name, out_idx = parse_tensor_name(in_name)
+        dtype, shape = tensors_meta[in_op_name][out_idx]
+        in_tensors.append(
+          TensorInfo(name='{}:{}'.format(in_op_name, out_idx),
+                     ugraph=ugraph,
+                     op_name=in_op_name,
+                     dtype=dtype,
+                     shape=shape,
+                     )
+        )
+      out_tensors = [TensorInfo(name='{}:{}'.format(node.name, out_idx),
                                 ugraph=ugraph,
-                                op_name=op.name,
-                                dtype=np.dtype(tensor.dtype.as_numpy_dtype),
-                                shape=cls._tf_parse_tshape(tensor.shape),
+                                op_name=node.name,
+                                dtype=dtype,
+                                shape=shape,
                                 )
-                     for tensor in op.outputs]
+                     for out_idx, (dtype, shape) in enumerate(tensors_meta[node.name])]
       op_type = node.op
       op_attr = node.attr
       op_info = OperationInfo(name=node.name,
@@ -83,10 +93,81 @@ class GraphDefParser(Parser):
       raise ValueError('unknown file format: %s' % pb_file)
     return graph_def, graph_name
 
+  @classmethod
+  def _tf_parse_tensors_meta(cls, graph_def):
+    """
+    Read the dtypes and shapes of output tensors from the NodeDefs
+
+    The dtypes are resolved with the registered OpDefs and the shapes are
+    read from ``_output_shapes``, so no :class:`tf.Graph` is constructed.
+    ``None`` is returned if any node lacks such information or an attr
+    its OpDef needs
+
+    Note that the shapes are the ones recorded when the graph was exported,
+    they are not inferred again. A GraphDef edited after export may carry
+    stale ``_output_shapes``, and the shapes of the parsed tensors will
+    then differ from the ones given by :meth:`_tf_import_tensors_meta`
+    """
+    registered_ops = op_def_registry.get_registered_ops()
+    tensors_meta = {}
+    for node in graph_def.node:
+      op_def = registered_ops.get(node.op, None)
+      if op_def is None or '_output_shapes' not in node.attr:
+        return None
+      attr_values = dict(
+        (attr_def.name, attr_def.default_value)
+        for attr_def in op_def.attr
+        if attr_def.HasField('default_value')
+      )
+      attr_values.update(node.attr)
+      out_dtypes = []
+      for arg_def in op_def.output_arg:
+        if any(
+          name and name not in attr_values
+          for name in [arg_def.type_list_attr, arg_def.type_attr, arg_def.number_attr]
+        ):
+          return None
+        if arg_def.type_list_attr:
+          out_dtypes.extend(attr_values[arg_def.type_list_attr].list.type)
+          continue
+        if arg_def.type_attr:
+          dtype = attr_values[arg_def.type_attr].type
+        else:
+          dtype = arg_def.type
+        num_tensors = 1
+        if arg_def.number_attr:
+          num_tensors = attr_values[arg_def.number_attr].i
+        out_dtypes.extend([dtype] * num_tensors)
+      out_shapes = node.attr['_output_shapes'].list.shape
+      if len(out_shapes) != len(out_dtypes):
+        return None
+      tensors_meta[node.name] = [
+        (
+          np.dtype(tf.as_dtype(dtype).as_numpy_dtype),
+          cls._tf_parse_tshape(tf.TensorShape(shape))
+        )
+        for dtype, shape in zip(out_dtypes, out_shapes)
+      ]
+    return tensors_meta
+
+  @classmethod
+  def _tf_import_tensors_meta(cls, graph_def):
+    graph = tf.Graph()
+    with graph.as_default():
+      tf.import_graph_def(graph_def, name='')
+    tensors_meta = {}
+    for node in graph_def.node:
+      op = graph.get_operation_by_name(node.name)
+      tensors_meta[node.name] = [
+        (np.dtype(tensor.dtype.as_numpy_dtype), cls._tf_parse_tshape(tensor.shape))
+        for tensor in op.outputs
+      ]
+    return tensors_meta
+
   @staticmethod
   def _tf_parse_tshape(t_shape):
     try:
-      shape = t_shape.as_list()
+      shape = tuple(t_shape.as_list())
     except ValueError:
       shape = None
     return shape
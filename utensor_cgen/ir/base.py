@@ -1,5 +1,6 @@
 # -*- coding: utf8 -*-
 import re
+from collections import OrderedDict
 from copy import deepcopy
 from functools import reduce
 
@@ -30,19 +31,27 @@ __all__ = [
 
 
 class _NoShallowCopyMixin(object):
+  __slots__ = ()
 
   def __copy__(self):
     raise RuntimeError('shallow copy is not allowed for type %s' % type(self))
 
 
+def _shape_to_tuple(shape):
+  if isinstance(shape, list):
+    return tuple(shape)
+  return shape
+
+
 class IRBase(object):
+  __slots__ = ()
 
   @property
   def all_supported_libs(self):
     return ['tensorflow']
 
 
-@attr.s(cmp=False)
+@attr.s(cmp=False, slots=True)
 class TensorInfo(IRBase, _NoShallowCopyMixin):
   """
   :param name: the name of the tensor
@@ -55,9 +64,9 @@ class TensorInfo(IRBase, _NoShallowCopyMixin):
   :param dtype: the data type of the elements.
   :type dtype: numpy.dtype
 
-  :param shape: the shape of the tensor. Should be a list
-    of integers or ``None``.
-  :type shape: list
+  :param shape: the shape of the tensor. Should be a tuple
+    of integers or ``None`` (a list is converted to tuple).
+  :type shape: tuple
 
   :param ugraph: a :class:`.uTensorGraph`, which this tensor belongs to.
     By passing an :class:`.uTensorGraph` object to the constructor, the
@@ -68,14 +77,17 @@ class TensorInfo(IRBase, _NoShallowCopyMixin):
   op_name = attr.ib(validator=instance_of(six.string_types))
   dtype = attr.ib(validator=instance_of(np.dtype))
 
-  shape = attr.ib(validator=instance_of((list, type(None))))
+  shape = attr.ib(
+    converter=_shape_to_tuple,
+    validator=instance_of((tuple, type(None)))
+  )
   
   @shape.validator
   def check(self, attrib, shape_values):
     if shape_values is not None:
       for v in shape_values:
         assert isinstance(v, (int, type(None))), \
-          "shape should be a list of integers"
+          "shape should be a tuple of integers"
           
   _ugraph = attr.ib(repr=False)
   @_ugraph.validator
@@ -115,7 +127,7 @@ class TensorInfo(IRBase, _NoShallowCopyMixin):
     :type dtype: numpy.dtype
 
     :param shape: the shape of the tensor
-    :type shape: list
+    :type shape: tuple
 
     :rtype: :class:`.TensorInfo`
     """
@@ -192,7 +204,7 @@ class TensorInfo(IRBase, _NoShallowCopyMixin):
     return (self.name == other.name) and (self._ugraph is other._ugraph)
 
 
-@attr.s(cmp=False, repr=False)
+@attr.s(cmp=False, repr=False, slots=True)
 class OperationInfo(IRBase, _NoShallowCopyMixin):
   """
   :param name: the name of the node
@@ -310,12 +322,12 @@ class OperationInfo(IRBase, _NoShallowCopyMixin):
 
     :rtype: List[:class:`OperationInfo`]
     """
-    in_ops = []
+    # insertion-ordered set of op names
+    in_ops = OrderedDict()
     for tensor in self.input_tensors:
       if tensor.op is None:
         continue
-      if tensor.op_name not in in_ops:
-        in_ops.append(tensor.op_name)
+      in_ops[tensor.op_name] = None
     return [self._ugraph.ops_info.get(name, None) for name in in_ops]
 
   @property
@@ -326,11 +338,12 @@ class OperationInfo(IRBase, _NoShallowCopyMixin):
 
     :rtype: List[:class:`OperationInfo`]
     """
-    out_ops = []
+    # insertion-ordered set of op names
+    out_ops = OrderedDict()
     for op in self._ugraph.ops:
       for in_tensor in op.input_tensors:
-        if in_tensor.op_name == self.name and op.name not in out_ops:
-          out_ops.append(op.name)
+        if in_tensor.op_name == self.name:
+          out_ops[op.name] = None
           break
     return [self._ugraph.ops_info[name] for name in out_ops]
 
@@ -480,14 +493,7 @@ class uTensorGraph(IRBase, _NoShallowCopyMixin, uTensorGraphBuilderMixin):
     """
     if not self._type_to_op_map:
       for op_info in self.ops_info.values():
-        op_type = op_info.op_type
-        ops = self._type_to_op_map.get(
-          op_type,
-          []
-        ) + [op_info]
-        self._type_to_op_map.update(
-          [(op_type, ops),]
-        )
+        self._type_to_op_map.setdefault(op_info.op_type, []).append(op_info)
     return self._type_to_op_map.get(given_op_type, [])
   
   @property
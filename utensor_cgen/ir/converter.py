@@ -275,7 +275,8 @@ class TensorProtoConverter(GenericTensorConverterMixin, TFConverterMixin):
     if dtype.fields is None:
       pass
     elif dtype[0] in [np.uint8, np.int8]:
-      np_array = np_array.astype(dtype[0])
+      # same itemsize, reinterpret the buffer rather than copying it
+      np_array = np_array.view(dtype[0])
     else:
       raise ValueError('Unsupported numpy dtype: %s' % dtype)
     return cls.__utensor_generic_type__(np_array=np_array,
@@ -364,10 +365,14 @@ class AttrValueConverter(GenericConverterMixin, TFConverterMixin):
   @classmethod
   @_check_tf_type
   def get_generic_value(cls, tf_value):
-    value_name = tf_value.WhichOneof('value')
-    value = getattr(tf_value, value_name)
-    if isinstance(value, np.ndarray):
-      value = self._handle_quant_array(value)
+    # AttrValue only has the `value` oneof, so the only set field is the value.
+    # ListFields gives the field and its value at once, which is cheaper than
+    # WhichOneof followed by getattr
+    fields = tf_value.ListFields()
+    if not fields:
+      raise ValueError('AttrValue without value: %s' % tf_value)
+    field_desc, value = fields[0]
+    value_name = field_desc.name
     return cls.__utensor_generic_type__(value_name=value_name,
                                         value=ConverterDispatcher.get_generic_value(value))
 
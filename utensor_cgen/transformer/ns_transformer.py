@@ -163,8 +163,9 @@ class TensorLifeProbe(Transformer):
 
   def _get_candidates(self, allocate_table, use_def_table, buffer_size, unit_size, in_o):
     ret = []
+    size = in_o.size
     for i in range(0, buffer_size, unit_size):
-      if self._check(allocate_table, use_def_table, in_o, i, i + in_o.size):
+      if self._check(allocate_table, use_def_table, in_o, i, i + size):
         ret.append(i)
     return ret
   
@@ -265,34 +266,55 @@ class DropoutTransformer(Transformer):
   KWARGS_NAMESCOPE = '_utensor_dropout'
   TARGET_NODENAME_PATTERN = re.compile(r'(dropout[_\w\d]*)/.*')
 
-  def __init__(self, name_pattern=r'(dropout[_\w\d]*)/.*'):
+  def __init__(self, name_pattern=r'(dropout[_\w\d]*)/.*', prune_graph=True):
     self._op_name_pattern = re.compile(name_pattern)
 
   def transform(self, ugraph):
+    """
+    Return a new graph with the dropout layers removed
+
+    If no op matches the name pattern, the given ``ugraph`` itself is
+    returned (no copy is made). It will be sorted in place and, with
+    ``prune_graph=False``, any later in-place transform will modify the
+    caller's graph as well
+    """
+    # match the op names only once
+    match_of = self._match_op_names(ugraph.ops_info)
+    if not any(match_of.values()):
+      # no dropout layer, nothing to remove
+      return ugraph
     new_graph = uTensorGraph(name=ugraph.name, output_nodes=ugraph.output_nodes)
-    dropout_input_map = self._find_input(ugraph)
+    op_name_of = {
+      t_info.name: parse_tensor_name(t_info.name)[0]
+      for op_info in ugraph.ops_info.values()
+      for t_info in op_info.input_tensors
+    }
+    match_of.update(
+      self._match_op_names(set(op_name_of.values()).difference(match_of))
+    )
+    dropout_input_map = self._find_input(ugraph, match_of)
     new_ops_info = {}
     for node_name in ugraph.ops_info:
-      match = self._op_name_pattern.match(node_name)
+      match = match_of[node_name]
       if match:
         # ignore all dropout nodes
         continue
       # replace inputs with dropout inputs
       op_info = ugraph.ops_info[node_name]
-      in_t_infos = [deepcopy(t_info, {'ugraph': new_graph}) 
-                    for t_info in op_info.input_tensors]
-      out_t_infos = [deepcopy(t_info, {'ugraph': new_graph}) 
-                    for t_info in op_info.output_tensors]
-      op_attr = deepcopy(op_info.op_attr)
-      for i, t_info in enumerate(in_t_infos):
-        op_name = parse_tensor_name(t_info.name)[0]
-        match = self._op_name_pattern.match(op_name)
+      in_t_infos = []
+      for t_info in op_info.input_tensors:
+        match = match_of[op_name_of[t_info.name]]
         if match:
           name_scope = match.group(1)
           # assume there should be only on input except keep_prob
-          dropout_in_tensor = dropout_input_map[name_scope]
-          in_t_infos.pop(i)
-          in_t_infos.insert(i, dropout_in_tensor)
+          in_t_infos.append(dropout_input_map[name_scope])
+        else:
+          in_t_infos.append(deepcopy(t_info, {'ugraph': new_graph}))
+      out_t_infos = [deepcopy(t_info, {'ugraph': new_graph}) 
+                    for t_info in op_info.output_tensors]
+      # op_attr is not modified here and OperationInfo makes its own dict,
+      # so the attribute values (weights included) can be shared
+      op_attr = op_info.op_attr
       new_op_info = OperationInfo(name=op_info.name,
                                   input_tensors=in_t_infos,
                                   n_inputs=len(in_t_infos),
@@ -307,26 +329,38 @@ class DropoutTransformer(Transformer):
     new_graph._lib_name = ugraph._lib_name
     return new_graph
 
-  def _find_dropout_clusters(self, ugraph):
-    clusters = defaultdict(lambda: [])
+  def _match_op_names(self, op_names):
+    """op_name --> match object of the name pattern (or None)
+    """
+    return dict(
+      (op_name, self._op_name_pattern.match(op_name))
+      for op_name in op_names
+    )
+
+  def _find_dropout_clusters(self, ugraph, match_of=None):
+    if match_of is None:
+      match_of = self._match_op_names(ugraph.topo_order)
+    clusters = defaultdict(set)
     for node_name in ugraph.topo_order:
-      match = self._op_name_pattern.match(node_name)
+      match = match_of[node_name]
       if match:
         name_scope = match.group(1)
-        clusters[name_scope].append(node_name)
+        clusters[name_scope].add(node_name)
     return dict(clusters)
 
-  def _find_input(self, ugraph):
+  def _find_input(self, ugraph, match_of=None):
     """dropout_name --> input_tensor_info
 
     input_tensor_info := the tensor info of a tensor which is not generated
                          in the dropout namescope but is consumed by ops in
                          dropout namescope with name not starts with 'keep_prob'
     """
-    clusters = self._find_dropout_clusters(ugraph)
+    if match_of is None:
+      match_of = self._match_op_names(ugraph.topo_order)
+    clusters = self._find_dropout_clusters(ugraph, match_of)
     input_map = {}
     for node_name in ugraph.topo_order:
-      match = self._op_name_pattern.match(node_name)
+      match = match_of[node_name]
       if match:
         name_scope = match.group(1)
         cluster = clusters[name_scope]
@@ -17,7 +17,6 @@ from toml import loads as _parse
 import idx2numpy as idx2np
 import tensorflow as tf
 from tensorflow.python.framework import graph_util
-from tensorflow.tools.graph_transforms import TransformGraph
 from utensor_cgen.logger import logger
 
 __all__ = ["save_idx", "save_consts", "save_graph", "log_graph",
@@ -319,34 +318,35 @@ def get_topologic_order(ugraph, init_nodes=None):
     )
   if init_nodes is None:
     init_nodes = ugraph.output_nodes
-  queue = deepcopy(init_nodes)
   visited = set()    # temporary mark
   perm_visit = set()  # Permanent mark
   ops_torder = []  # L
 
-  def visit(node_name):
-    if node_name in perm_visit:
-      return
-    if node_name in visited:
-      raise ValueError("Input graph is not a DAG")
-    visited.add(node_name)
-    op_info = ugraph.ops_info.get(node_name, None)
-    if not op_info:
-      return
-
-    for t_info in op_info.input_tensors:
-      # NT: we should not rely on tensor-name conventions for back-tracing
-      # op_name = parse_tensor_name(t_info.name)[0]
-      # It would be nice to rely on something similar to get_tensor_node_names(), but based on ops_info instead of topo_order
-      op_name = t_info.op_name
-      visit(op_name)
-
-    perm_visit.add(node_name)
-    ops_torder.insert(0, node_name)
-
-  while queue:
-    node_name = queue.pop(0)
-    visit(node_name)
+  # iterative post-order DFS; each stack frame holds an op and an
+  # iterator over its remaining input tensors
+  for init_name in init_nodes:
+    if init_name in perm_visit or init_name not in ugraph.ops_info:
+      continue
+    visited.add(init_name)
+    stack = [(init_name, iter(ugraph.ops_info[init_name].input_tensors))]
+    while stack:
+      node_name, input_iter = stack[-1]
+      for t_info in input_iter:
+        # NT: we should not rely on tensor-name conventions for back-tracing
+        # op_name = parse_tensor_name(t_info.name)[0]
+        op_name = t_info.op_name
+        if op_name in perm_visit or op_name not in ugraph.ops_info:
+          continue
+        if op_name in visited:
+          raise ValueError("Input graph is not a DAG")
+        visited.add(op_name)
+        stack.append((op_name, iter(ugraph.ops_info[op_name].input_tensors)))
+        break
+      else:
+        stack.pop()
+        perm_visit.add(node_name)
+        ops_torder.append(node_name)
+  ops_torder.reverse()
   return ops_torder
 
 
@@ -385,21 +385,21 @@ def prune_graph(ugraph):
   new_ugraph = deepcopy(ugraph)
   # BFS to find all ops you need
   ops_in_need = set(ugraph.output_nodes)
-  queue = [name for name in ugraph.output_nodes]
+  # tensor name -> name of the op generating it
+  tensor_to_op = {
+    t.name: op_name
+    for op_name, op_info in ugraph.ops_info.items()
+    for t in op_info.output_tensors
+  }
+  queue = deque(ugraph.output_nodes)
   visited = set([])
   while queue:
-    op_name = queue.pop(0)
-    #TODO: move the code below to a standalone function.
-    # Maybe using a more extensive data structure
-    # or simply: in_ops = [node.name for node in ugraph.ops_info[op_name].input_nodes]
-    tensors_in = set([t.name for t in ugraph.ops_info[op_name].input_tensors])
+    op_name = queue.popleft()
     in_ops = set()
-    for it_node in ugraph.ops_info:
-      if it_node == op_name:
-        continue
-      it_tensors_out = [t.name for t in ugraph.ops_info[it_node].output_tensors]
-      if not tensors_in.isdisjoint(it_tensors_out):
-        in_ops.add(it_node)
+    for t in ugraph.ops_info[op_name].input_tensors:
+      in_op_name = tensor_to_op.get(t.name, None)
+      if in_op_name is not None and in_op_name != op_name:
+        in_ops.add(in_op_name)
 
     queue.extend([name for name in in_ops if name not in visited])
     visited.update(in_ops)